@@ -1,10 +1,18 @@
-from . import cosmology
-from . import fit
-from . import io
-from . import maths
-from . import plots
-from . import sampling
-from . import utils
+import importlib as _importlib
 
 from .__version__ import __version__
-__authors__ = ['Adam Batten (@abatten), ']
\ No newline at end of file
+__authors__ = ['Adam Batten (@abatten), ']
+
+# The submodules import heavy packages (astropy, matplotlib, scipy), so
+# they are only imported when they are first accessed.
+_SUBMODULES = ('cosmology', 'fit', 'io', 'maths', 'plots', 'sampling', 'utils')
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return _importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
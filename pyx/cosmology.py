@@ -12,11 +12,51 @@ __all__ = [
     'z_to_cMpc',
 ]
 
+import collections
+import functools
+
 import numpy as np
 import astropy.units as apu
 import astropy.constants as apc
 import astropy.cosmology as acosmo
 import astropy.cosmology.units as acu
+from astropy.cosmology import FLRW
+from scipy import interpolate
+
+
+# The cosmologies that can be accessed with a string keyword.
+_AVAILABLE_COSMOLOGIES = {
+    "WMAP5": acosmo.WMAP5,
+    "WMAP7": acosmo.WMAP7,
+    "WMAP9": acosmo.WMAP9,
+    "Planck13": acosmo.Planck13,
+    "Planck15": acosmo.Planck15,
+    "Planck18": acosmo.Planck18,
+}
+
+
+# Distances (Mpc) below this are treated as zero. 1e-4 Mpc is approx 100 pc.
+_DISTANCE_ZERO_THRESHOLD_MPC = 1e-4
+
+# The redshifts used to tabulate the comoving distance of a cosmology.
+# Interpolating over the table is much faster than root-finding each
+# distance with astropy.cosmology.z_at_value.
+_Z_GRID = np.concatenate(([0.0], np.logspace(-4, 3, 4096)))
+
+# The largest redshift searched for distances beyond the table.
+_Z_MAX_FALLBACK = 1e6
+
+# The interpolators for the most recently used cosmologies and
+# quantities, oldest first. Only a few are kept, so code that makes a
+# new cosmology for every call (e.g. sampling over H0) does not fill
+# up memory with tables.
+_REDSHIFT_INTERPOLATORS = collections.OrderedDict()
+_MAX_REDSHIFT_INTERPOLATORS = 8
+
+# Tabulating a cosmology costs about as much as calculating the
+# comoving distance of a few thousand redshifts directly. Inputs up to
+# this size are calculated directly unless the table already exists.
+_MAX_DIRECT_REDSHIFTS = 100
 
 
 def get_cosmology_from_name(cosmology):
@@ -36,28 +76,10 @@ def get_cosmology_from_name(cosmology):
         An astropy cosmology.
 
     """
-    available_cosmologies = {
-        "WMAP5": acosmo.WMAP5,
-        "WMAP7": acosmo.WMAP7,
-        "WMAP9": acosmo.WMAP9,
-        "Planck13": acosmo.Planck13,
-        "Planck15": acosmo.Planck15,
-        "Planck18": acosmo.Planck18,
-    }
-
     # If the user uses a string for the cosmology look it up in the dict.
     # If they specify a cosmology class, use that instead.
-    from astropy.cosmology import FLRW
-
     if isinstance(cosmology, str):
-        if cosmology in available_cosmologies.keys():
-            cosmo = available_cosmologies[cosmology]
-        else:
-            msg = (f"""The cosmology '{cosmology}' is not in the list of
-            available cosmologies with string keywords. The list
-            if available cosmologies accessable via keyword are:
-            {available_cosmologies.keys()}""")
-            raise ValueError(msg)
+        cosmo = _get_cosmology_by_name(cosmology)
 
     elif isinstance(cosmology, FLRW):
         cosmo = cosmology
@@ -65,6 +87,91 @@ def get_cosmology_from_name(cosmology):
     return cosmo
 
 
+@functools.lru_cache(maxsize=None)
+def _get_cosmology_by_name(name):
+    """
+    Get an astropy cosmology from its string keyword. The result is
+    cached so repeated lookups of the same keyword are cheap.
+
+    """
+    cosmo = _AVAILABLE_COSMOLOGIES.get(name)
+    if cosmo is None:
+        msg = (f"""The cosmology '{name}' is not in the list of
+        available cosmologies with string keywords. The list
+        if available cosmologies accessable via keyword are:
+        {_AVAILABLE_COSMOLOGIES.keys()}""")
+        raise ValueError(msg)
+    return cosmo
+
+
+def _get_redshift_interpolators(cosmo, quantity="comoving_distance", unit=apu.Mpc):
+    """
+    Get interpolators that convert between redshift and a quantity
+    that increases monotonically with redshift, such as the comoving
+    distance or lookback time.
+
+    The quantity is only tabulated once per cosmology, repeated calls
+    with the same cosmology reuse the same interpolators.
+
+    Parameters
+    ----------
+    cosmo : astropy.cosmology.core.FLRW
+        An astropy cosmology.
+    quantity : str, optional
+        The name of the cosmology method that calculates the quantity.
+        Default: 'comoving_distance'
+    unit : astropy.units.Unit, optional
+        The unit of the tabulated quantity.
+        Default: astropy.units.Mpc
+
+    Returns
+    -------
+    forward : scipy.interpolate.CubicSpline
+        The interpolator from redshift to the quantity.
+    inverse : scipy.interpolate.CubicSpline
+        The interpolator from the quantity to redshift.
+
+    """
+    key = _redshift_interpolator_key(cosmo, quantity, unit)
+    if key in _REDSHIFT_INTERPOLATORS:
+        _REDSHIFT_INTERPOLATORS.move_to_end(key)
+    else:
+        grid = getattr(cosmo, quantity)(_Z_GRID).to_value(unit)
+        _REDSHIFT_INTERPOLATORS[key] = (
+            interpolate.CubicSpline(_Z_GRID, grid),
+            interpolate.CubicSpline(grid, _Z_GRID),
+        )
+        # Forget the least recently used table.
+        if len(_REDSHIFT_INTERPOLATORS) > _MAX_REDSHIFT_INTERPOLATORS:
+            _REDSHIFT_INTERPOLATORS.popitem(last=False)
+    return _REDSHIFT_INTERPOLATORS[key]
+
+
+def _redshift_interpolator_key(cosmo, quantity, unit):
+    """
+    Get the key of a cosmology and quantity in _REDSHIFT_INTERPOLATORS.
+
+    """
+    # Astropy cosmologies are not hashable, but their repr contains
+    # all of their parameters.
+    return (repr(cosmo), quantity, unit)
+
+
+def _evaluate_sorted(interpolator, x):
+    """
+    Evaluate an interpolator at x in ascending order.
+
+    The spline searches for the interval of each point starting from
+    the interval of the previous point, so sorted points are found much
+    faster than points in a random order.
+
+    """
+    order = np.argsort(x)
+    result = np.empty_like(x)
+    result[order] = interpolator(x[order])
+    return result
+
+
 def z_to_cMpc(redshift, cosmology='Planck18'):
     """
     Convert a redshift into a comoving distance with units of Mpc.
@@ -104,13 +211,36 @@ def z_to_cMpc(redshift, cosmology='Planck18'):
     """
 
     cosmo = get_cosmology_from_name(cosmology)
-    distance = cosmo.comoving_distance(redshift)
+
+    redshift = np.asarray(redshift, dtype=float)
+    redshift_is_scalar = redshift.ndim == 0
+    redshift = np.atleast_1d(redshift)
+
+    key = _redshift_interpolator_key(cosmo, "comoving_distance", apu.Mpc)
+    if redshift.size <= _MAX_DIRECT_REDSHIFTS and key not in _REDSHIFT_INTERPOLATORS:
+        # A few redshifts are faster to calculate directly than to
+        # tabulate a new cosmology for.
+        distance = cosmo.comoving_distance(redshift).to_value(apu.Mpc)
+
+    else:
+        # Interpolate the tabulated comoving distance for every redshift.
+        comoving_distance, _ = _get_redshift_interpolators(cosmo, "comoving_distance", apu.Mpc)
+        distance = _evaluate_sorted(comoving_distance, redshift)
+
+        # Redshifts outside the table fall back to the exact calculation.
+        outside_table = (redshift < 0) | (redshift > comoving_distance.x[-1])
+        if np.any(outside_table):
+            distance[outside_table] = cosmo.comoving_distance(redshift[outside_table]).to_value(apu.Mpc)
 
     # If the redshift is really small the user likely wants the result
-    # to be at 0.0 Mpc. 1e-4 Mpc is 100 pc.
-    distance_zero_threshold = 1e-4 * apu.Mpc
-    distance[distance < distance_zero_threshold] = 0
-    return distance
+    # to be at 0.0 Mpc.
+    distance = np.where(distance < _DISTANCE_ZERO_THRESHOLD_MPC, 0.0, distance)
+
+    # Return a scalar if the input redshift was a scalar.
+    if redshift_is_scalar:
+        distance = distance[0]
+
+    return distance * apu.Mpc
 
 
 def cMpc_to_z(cMpc, cosmology="Planck18"):
@@ -153,37 +283,56 @@ def cMpc_to_z(cMpc, cosmology="Planck18"):
 
     cosmo = get_cosmology_from_name(cosmology)
 
-    # If the array doesn't have units, apply them for calculation later.
-    if not isinstance(cMpc, apu.Quantity):
-        cMpc = cMpc * apu.Mpc
-
-    # If the comoving distance is really small the user likely wants the
-    # result to be at 0.0 redshift. 1e-4 Mpc is approx 100 pc.
-    distance_zero_threshold = 1e-4 * apu.Mpc
+    # Work with the distances as a plain array in Mpc, so there are no
+    # unit checks in the calculation. Units are applied to the result.
+    if isinstance(cMpc, apu.Quantity):
+        distance = cMpc.to_value(apu.Mpc)
+    else:
+        distance = np.asarray(cMpc, dtype=float)
 
     # Check of the input distances is a list or a scalar.
-    distance_is_scalar = cMpc.isscalar
+    distance_is_scalar = distance.ndim == 0
+    distance = np.atleast_1d(distance)
 
-    # If the distance is a scalar, perform a scalar calculation.
-    if distance_is_scalar:
-        if cMpc >= distance_zero_threshold:
-            redshift = acosmo.z_at_value(cosmo.comoving_distance, cMpc)
-        else:
-            redshift = 0.0
+    key = _redshift_interpolator_key(cosmo, "comoving_distance", apu.Mpc)
+    if distance.size <= _MAX_DIRECT_REDSHIFTS and key not in _REDSHIFT_INTERPOLATORS:
+        # A few distances are faster to solve directly than to
+        # tabulate a new cosmology for.
+        redshift = np.zeros_like(distance)
+        to_solve = np.flatnonzero(distance >= _DISTANCE_ZERO_THRESHOLD_MPC)
 
-    # If the distance is an array, perform array calculation
     else:
-        # Default value is 0.0 redshift
-        redshift = np.zeros_like(cMpc.value)
+        # Invert the tabulated comoving distance for every distance at once.
+        _, inverse_comoving_distance = _get_redshift_interpolators(cosmo, "comoving_distance", apu.Mpc)
+        redshift = _evaluate_sorted(inverse_comoving_distance, distance)
+
+        # Distances beyond the table fall back to the exact calculation.
+        to_solve = np.flatnonzero(distance > inverse_comoving_distance.x[-1])
+
+    # The search for the redshift must extend past the end of the table.
+    if to_solve.size > 0:
+        max_distance = cosmo.comoving_distance(_Z_MAX_FALLBACK).to_value(apu.Mpc)
+        if np.any(distance[to_solve] >= max_distance):
+            msg = (f"Comoving distances must be less than {max_distance:.2f} Mpc "
+                   f"(z = {_Z_MAX_FALLBACK:.0e}) in this cosmology.")
+            raise ValueError(msg)
+
+        for idx in to_solve:
+            redshift[idx] = acosmo.z_at_value(cosmo.comoving_distance, distance[idx] * apu.Mpc,
+                                              zmax=_Z_MAX_FALLBACK).value
 
-        for i, dist in enumerate(cMpc):
-            if dist >= distance_zero_threshold:
-                redshift[i] = acosmo.z_at_value(cosmo.comoving_distance, dist)
+    # If the comoving distance is really small the user likely wants the
+    # result to be at 0.0 redshift.
+    redshift = np.where(distance >= _DISTANCE_ZERO_THRESHOLD_MPC, redshift, 0.0)
+
+    # Return a scalar if the input distance was a scalar.
+    if distance_is_scalar:
+        redshift = redshift[0]
 
     return redshift * acu.redshift
 
 
-def scale_factor(redshift):
+def scale_factor(redshift, out=None, dtype=None):
     """
     Calculates the scale factor, a, at a given redshift.
 
@@ -193,6 +342,15 @@ def scale_factor(redshift):
     ----------
     redshift : array-like
         The redshift values.
+    out : np.ndarray or None, optional
+        An array with the same shape as redshift to store the result
+        in. If None, a new array is allocated.
+        Default: None
+    dtype : data-type or None, optional
+        The floating point type of the result. Use np.float32 to halve
+        the memory of large arrays when full precision is not needed.
+        If None, the type follows NumPy's rules for the redshift.
+        Default: None
 
     Returns
     -------
@@ -208,4 +366,11 @@ def scale_factor(redshift):
     array([1, 0.5, 0.3333333, 0.25])
 
     """
-    return (1 + redshift)**-1.0
+    if out is None and dtype is None and np.isscalar(redshift):
+        return 1.0 / (1.0 + redshift)
+
+    # Calculate 1 + z and its reciprocal in the same buffer.
+    a = np.add(redshift, 1.0, out=out, dtype=dtype)
+    if isinstance(a, np.ndarray):
+        return np.reciprocal(a, out=a)
+    return np.reciprocal(a)
@@ -5,6 +5,7 @@ A collection of various functions for fitting data.
 
 """
 import numpy as np
+from scipy import linalg
 
 __all__ = [
     'fit_poly_least_squares',
@@ -48,17 +49,20 @@ def fit_poly_least_squares(xvals, yvals, yerr, order=1):
     # Vandermonde matrix
     A = np.vander(xvals, order+1, increasing=True)
 
-    # Matrix of Y Uncert
-    C = np.diag(yerr * yerr)
-    Cinv = np.linalg.inv(C)
+    # Whiten the data by the Y Uncert so the weighted least squares
+    # becomes an ordinary least squares problem.
+    Aw = A / yerr[:, np.newaxis]
+    yw = yvals / yerr
 
     # See Hogg+2010 How to Fit a Model to Data, p.g. 4-5.
-    AT_Cinv_A = A.T @ Cinv @ A
-    AT_Cinv_Y = A.T @ Cinv @ yvals
-    best_fit = np.linalg.inv(AT_Cinv_A) @ AT_Cinv_Y
+    # Solving with the QR decomposition of Aw avoids forming the poorly
+    # conditioned A.T @ Cinv @ A = R.T @ R.
+    Q, R = np.linalg.qr(Aw)
+    best_fit = linalg.solve_triangular(R, Q.T @ yw)
 
-    uncerts = np.sqrt(np.diag(np.linalg.inv(AT_Cinv_A)))
-    chisq, redchisq = calculate_poly_chisq(best_fit, xvals, yvals, yerr, order=order)
+    cov = linalg.cho_solve((R, False), np.eye(order + 1))
+    uncerts = np.sqrt(np.diag(cov))
+    chisq, redchisq = _whitened_chisq(best_fit, Aw, yw, order=order)
 
     return best_fit, uncerts, chisq, redchisq
 
@@ -125,14 +129,22 @@ def calculate_poly_chisq(fit, xvals, yvals, yerr, order=1):
         reduced chi = chi / (N - order - 1)
     
     """
-    # Vandermonde matrix
-    A = np.vander(xvals, order+1, increasing=True)
+    # Evaluate the model with Horner's method rather than building
+    # the Vandermonde matrix.
+    residuals = (yvals - np.polynomial.polynomial.polyval(xvals, fit)) / yerr
+    chisq = residuals @ residuals
+    redchisq = chisq/(len(yvals) - (order+1))
+    return chisq, redchisq
 
-    # Matrix of Y Uncert
-    C = np.diag(yerr * yerr)
-    Cinv = np.linalg.inv(C)
 
-    residuals = yvals - A@fit
-    chisq = residuals.T @ Cinv @ residuals
-    redchisq = chisq/(len(yvals) - (order+1))
+def _whitened_chisq(fit, Aw, yw, order=1):
+    """
+    Get the chi-squared and reduced chi-squared from a Vandermonde
+    matrix and y-coordinates that have been divided by the y
+    uncertainties.
+
+    """
+    residuals = yw - Aw@fit
+    chisq = residuals @ residuals
+    redchisq = chisq/(len(yw) - (order+1))
     return chisq, redchisq
\ No newline at end of file
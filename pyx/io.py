@@ -12,14 +12,21 @@ __all__ = [
     'write_row',
     ]
 
-try:
-    import h5py
-    import_h5py = True
-except ImportError:
-    import_h5py = False
-
 import numpy as np
-import yaml
+
+
+def _require_h5py():
+    """
+    Imports h5py when it is first needed, as it is slow to import and
+    is an optional dependency.
+
+    """
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError("This function requires h5py!")
+    return h5py
+
 
 def dict_to_hdf5_attributes(item, attrs_dict):
     """
@@ -36,16 +43,13 @@ def dict_to_hdf5_attributes(item, attrs_dict):
         of the attribute.
 
     """
-    if not import_h5py:
-        raise ImportError("This function requires h5py!")
-    else:
-        if not isinstance(attrs_dict, dict):  # Must be a dict!
-            raise TypeError("attrs_dict must be a dictionary") 
+    _require_h5py()
 
-        # Sort into alphabetical order
-        attributes = sorted(attrs_dict.items())
-        for key, value in attributes:
-            item.attrs[key] = value
+    if not isinstance(attrs_dict, dict):  # Must be a dict!
+        raise TypeError("attrs_dict must be a dictionary") 
+
+    # Sort into alphabetical order
+    item.attrs.update(sorted(attrs_dict.items()))
 
 
 def dict_to_hdf5_group(hdf5_file, attrs_dict, group_name):
@@ -63,12 +67,11 @@ def dict_to_hdf5_group(hdf5_file, attrs_dict, group_name):
         The name of the new group.
 
     """
-    if not import_h5py:
-        raise ImportError("This function requires h5py!")
-    else:
-        hdf5_file.create_group(group_name)
-        group = hdf5_file[group_name]
-        dict_to_hdf5_attributes(group, attrs_dict)
+    _require_h5py()
+
+    hdf5_file.create_group(group_name)
+    group = hdf5_file[group_name]
+    dict_to_hdf5_attributes(group, attrs_dict)
 
 
 def load_yaml(path):
@@ -89,8 +92,13 @@ def load_yaml(path):
         A dictionary containing all the data in the YAML.
 
     """
+    import yaml
+
+    # Use the libyaml parser when PyYAML has been built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     with open(path, 'r') as file_object:
-        data = yaml.safe_load(file_object)
+        data = yaml.load(file_object, Loader=loader)
         return data
 
 
@@ -114,15 +122,18 @@ def write_row(output, data, col_width=16, decimals=4):
         Default: 4
 
     """
-    row = f""
     if isinstance(data, list):
         data = np.array(data)
    
-    if data.dtype.type in (np.str_,):
-        for item in data:
-            row = f"{row}{item:<{col_width}}"
+    # Build the format of a column once and format the row in one pass.
+    # Dispatch on the dtype kind so strings and numbers of any width
+    # are handled.
+    if data.dtype.kind in ("U", "S"):
+        column_format = f"%-{col_width}s"
+        if data.dtype.kind == "S":
+            data = data.astype(str)
     else:
-        for item in data:
-            row = f"{row}{item:<{col_width}.{decimals}f}"
+        column_format = f"%-{col_width}.{decimals}f"
 
-    output.write(f"{row}\n")
+    row_format = column_format * len(data)
+    output.write(f"{row_format % tuple(data)}\n")
@@ -25,7 +25,26 @@ __all__ = [
     ]
 
 import numpy as np
-from scipy import interpolate, special
+from scipy import special
+
+
+# Conversion factors between degrees and radians.
+_DEG2RAD = np.pi / 180
+_RAD2DEG = 180 / np.pi
+
+# The accepted names of the axes and angle units.
+_X_AXIS_NAMES = frozenset(['x', 'xaxis', 'x-axis'])
+_Y_AXIS_NAMES = frozenset(['y', 'yaxis', 'y-axis'])
+_DEGREE_NAMES = frozenset(['deg', 'degrees'])
+_RADIAN_NAMES = frozenset(['rad', 'radians'])
+
+# The angle of a full rotation in each angle unit.
+_FULL_ROTATIONS = {
+    'deg': 360,
+    'degrees': 360,
+    'rad': 2 * np.pi,
+    'radians': 2 * np.pi,
+}
 
 
 def angle_of_line_through_points(point, point2=(0.0, 0.0), axis='x', units='deg'):
@@ -35,8 +54,9 @@ def angle_of_line_through_points(point, point2=(0.0, 0.0), axis='x', units='deg'
 
     Parameters
     ----------
-    point : (float, float)
-        The point.
+    point : (float, float) or (np.ndarray, np.ndarray)
+        The point. To calculate the angles of many lines at once, pass
+        arrays of the x and y coordinates.
     point2 : (float, float), optional
         A second point to define the line.
         Default: (0.0, 0.0)
@@ -49,26 +69,29 @@ def angle_of_line_through_points(point, point2=(0.0, 0.0), axis='x', units='deg'
 
     Returns
     -------
-    angle : float
+    angle : float or np.ndarray
         The angle to the axis.
 
     """
     x, y = point
     x0, y0 = point2
-    xdelta = x - x0
-    ydelta = y - y0
+    xdelta = np.subtract(x, x0)
+    ydelta = np.subtract(y, y0)
+
+    axis = axis.lower()
+    units = units.lower()
     
     # Can swap the order to calculate angle to y axis.
-    if axis.lower() in ['x', 'xaxis', 'x-axis']:
+    if axis in _X_AXIS_NAMES:
         rad = np.arctan2(ydelta, xdelta)
-    elif axis.lower() in ['y', 'yaxis', 'y-axis']:
+    elif axis in _Y_AXIS_NAMES:
         rad = np.arctan2(xdelta, ydelta)
 
-    if units.lower() in ['rad', 'radians']:
+    if units in _RADIAN_NAMES:
         return rad
 
-    elif units.lower() in ['deg', 'degrees']:
-        deg = rad2deg(rad)
+    elif units in _DEGREE_NAMES:
+        deg = rad * _RAD2DEG
         return deg
 
 
@@ -87,7 +110,8 @@ def bin_centres(bin_edges):
         An array of bin centers of length N-1.
     
     """
-    return bin_edges[:-1] + np.diff(bin_edges)/2
+    bin_edges = np.asarray(bin_edges)
+    return 0.5 * (bin_edges[1:] + bin_edges[:-1])
 
 def deg2rad(theta, wrap=False):
     """
@@ -106,7 +130,7 @@ def deg2rad(theta, wrap=False):
     rad : float or np.ndarray
         The angle or angle array theta in radians.
     """
-    rad = theta * np.pi / 180
+    rad = theta * _DEG2RAD
     if wrap:
           rad = rad % (2*np.pi)
     return rad
@@ -130,10 +154,11 @@ def hist_pdf(hist, bin_widths):
         The probability density function.
 
     """
-    if np.sum(hist) < 1e-16:
-        pdf = np.zeros(len(hist))
+    hist_sum = np.sum(hist)
+    if hist_sum < 1e-16:
+        pdf = np.zeros_like(hist, dtype=np.float64)
     else:
-        pdf = hist / bin_widths / np.sum(hist)
+        pdf = hist / (bin_widths * hist_sum)
     return pdf
 
 
@@ -144,9 +169,10 @@ def linearly_interpolate_pdfs(sample, xvals, pdfs):
 
     Parameters
     ----------
-    sample : float
+    sample : float or np.ndarray
         A sample scalar to generate an interpolate PDF.
-        This sample value sould be between the xvals.
+        This sample value sould be between the xvals. If an array of
+        M samples is given, a PDF is interpolated for each sample.
     xvals : (float, float)
         Two scalars that are each associated with a PDF.
     pdfs : (np.ndarray, np.ndarray) 
@@ -156,16 +182,18 @@ def linearly_interpolate_pdfs(sample, xvals, pdfs):
     Returns
     -------
     interp_pdf : np.ndarray
-        The interpolated PDF at the sample value.
+        The interpolated PDF at the sample value. If sample is an array
+        of M samples, an M x N array with the PDF of each sample as
+        a row.
 
     """
     x1, x2 = xvals
     pdf1, pdf2 = pdfs
 
     grad = (pdf2 - pdf1) / (x2 - x1)
-    dist = sample - x1
+    dist = np.subtract(sample, x1)
 
-    return grad*dist + pdf1
+    return np.multiply.outer(dist, grad) + pdf1
 
 
 def linspace_angles(start, stop, num=50, unit='deg', **kwargs):
@@ -195,12 +223,9 @@ def linspace_angles(start, stop, num=50, unit='deg', **kwargs):
 
     """
 
-    if unit.lower() in ['degrees', 'deg']:
-        rotation_angle = 360
-    elif unit.lower() in ['radians', 'rad']:
-        rotation_angle = 2 * np.pi
+    rotation_angle = _FULL_ROTATIONS[unit.lower()]
 
-    if start < stop:
+    if start <= stop:
         samples = np.linspace(start, stop, num, **kwargs) % rotation_angle
     elif start > stop:
         # This uses the fact that angles are cyclic.
@@ -218,6 +243,9 @@ def moving_mean(x, w, mode='full'):
     Uses a convolution to calculate the moving average wintin a window.
     = np.convolve(x, np.ones(w), mode=mode) / w
 
+    For wide windows the moving sums are instead taken as differences
+    of the cumulative sum, which costs O(N) regardless of w.
+
     Parameters
     ----------
     x : np.ndarray or array-like
@@ -246,7 +274,35 @@ def moving_mean(x, w, mode='full'):
         The moving average of the array x within the window.
 
     """
-    return np.convolve(x, np.ones(w), mode=mode) / w
+    x = np.asarray(x)
+
+    # The convolution is faster for narrow windows. It is also used
+    # when x has a NaN or inf, which would otherwise spread through the
+    # cumulative sum to every later window.
+    if w < 16 or not np.isfinite(x).all():
+        return np.convolve(x, np.ones(w), mode=mode) / w
+
+    n = len(x)
+
+    # The start and length of each mode within the 'full' output.
+    if mode == 'full':
+        start, length = 0, n + w - 1
+    elif mode == 'same':
+        start, length = (min(n, w) - 1) // 2, max(n, w)
+    elif mode == 'valid':
+        start, length = min(n, w) - 1, max(n, w) - min(n, w) + 1
+    else:
+        raise ValueError(f"mode must be one of 'full', 'same' or 'valid', not '{mode}'")
+
+    # Cumulative sum of x padded with w zeros before and w - 1 zeros
+    # after, so each moving sum is the difference of two elements.
+    # Complex input keeps its imaginary part, as with np.convolve.
+    cumsum = np.zeros(n + 2 * w - 1, dtype=np.result_type(x, np.float64))
+    np.cumsum(x, out=cumsum[w:n + w])
+    cumsum[n + w:] = cumsum[n + w - 1]
+
+    moving_sum = cumsum[start + w:start + w + length] - cumsum[start:start + length]
+    return moving_sum / w
 
 
 def pdf_mean(x, pdf, dx=None):
@@ -306,19 +362,19 @@ def pdf_percentile(x, pdf, percentile):
         The x values of the PDF.
     pdf : np.ndarray
         The value of the PDF at x.
-    percentile : float
+    percentile : float or np.ndarray
         The percentile of the PDF (range 0 - 1).
 
     Returns
     -------
-    value : float
+    value : float or np.ndarray
         The x value that corresponds to the given percentile.
 
     """
-    cumsum = np.cumsum(pdf)
-    normed_cumsum = cumsum / cumsum[-1]
-    interpolated_cumsum = interpolate.interp1d(normed_cumsum, x)
-    return interpolated_cumsum(percentile)
+    # Normalise the cumulative sum in place to avoid a second array.
+    normed_cumsum = np.cumsum(pdf, dtype=np.float64)
+    normed_cumsum /= normed_cumsum[-1]
+    return np.interp(percentile, normed_cumsum, x)
 
 
 def pdf_std(x, pdf, dx=None):
@@ -373,8 +429,12 @@ def pdf_var(x, pdf, dx=None):
     if dx is None:
         # If no dx is provided assume they are linearly spaced
         dx = (x[-1] - x[0]) / len(x)
-    mean = pdf_mean(x, pdf, dx)
-    return np.sum(pdf * dx * (x - mean)**2)
+    # Weight each x by its probability once and reuse the weights for
+    # both the mean and the variance.
+    weights = pdf * dx
+    mean = np.dot(weights, x)
+    deviation = x - mean
+    return np.dot(weights, deviation * deviation)
 
 
 def rad2deg(theta, wrap=False):
@@ -395,7 +455,7 @@ def rad2deg(theta, wrap=False):
         The angle or angle array theta in degrees.
 
     """
-    deg = theta * 180 / np.pi
+    deg = theta * _RAD2DEG
     if wrap:
           deg = deg % (360)
     return deg
@@ -434,20 +494,12 @@ def rebin1d(array, bin_size):
     # Calculate the length of the new array
     # Note that if the array isn't divisible by bin_size
     # It will leave off the remaining bins
-    new_size = int(array.size / bin_size)
-
-    # Generate a new empty array for the new bins
-    new_array = np.zeros(new_size)
+    array = np.asarray(array)
+    new_size = array.size // bin_size
 
-    # Loop over each of the new bins
-    for idx in range(new_size):
-        # Calculate the start and end points for each new bin
-        start_idx = idx * bin_size
-        end_idx = start_idx + bin_size
-        # Combine the bins between start_idx and end_idx
-        new_array[idx] = np.sum(array[start_idx:end_idx])
-            
-    return new_array
+    # Stack each group of bin_size bins into a row and combine the rows
+    new_array = array[:new_size * bin_size].reshape(new_size, bin_size)
+    return np.sum(new_array, axis=1, dtype=np.float64)
 
 
 def reshape_to_1D(array):
@@ -463,10 +515,11 @@ def reshape_to_1D(array):
     -------
     array1d : np.ndarray
         The output 1D array of length N x M x ..
+        This is a view of the input (not a copy) when the input is
+        C-contiguous.
 
     """
-    total_elements = np.prod(array.shape)
-    return np.reshape(array, total_elements)
+    return np.ravel(array)
 
 
 def sigma_pdf_percentiles(sigma):
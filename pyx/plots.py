@@ -12,23 +12,58 @@ __all__ = [
     'pcolormesh2d'
     ]
 
+import functools
 import os
 from glob import glob
 
 import numpy as np
 import matplotlib.pyplot as plt
-import astropy.units as apu
-import astropy.cosmology as acosmo
-from pyx.cosmology import get_cosmology_from_name
 
 
+@functools.lru_cache(maxsize=1)
 def _available_stylesheets():
+    # The style sheets shipped with pyx do not change at runtime, so
+    # the directory is only scanned once.
     style_sheet_location = os.path.join(os.path.dirname(__file__), "mpl_style_sheets")
     files = sorted(glob(os.path.join(style_sheet_location, "*.mplstyle")))
-    available_stylesheets = [f.split(".")[0].split('/')[-1] for f in files]
+    available_stylesheets = tuple(os.path.splitext(os.path.basename(f))[0] for f in files)
     return available_stylesheets
 
 
+# The keyword arguments that pcolormesh and imshow treat the same way.
+_IMSHOW_SAFE_KWARGS = frozenset([
+    "alpha", "cmap", "label", "norm", "rasterized", "vmax", "vmin", "zorder",
+])
+
+
+def _regular_pixel_edges(vals, num_pixels):
+    """
+    Get the outer edges of pixels along one axis if they are regularly
+    spaced, otherwise None.
+
+    The values can either be the pixel centres (num_pixels values) or
+    the pixel edges (num_pixels + 1 values), as in pcolormesh.
+
+    """
+    vals = np.asarray(vals, dtype=float)
+    if vals.ndim != 1 or vals.size < 2:
+        return None
+
+    # Only increasing values are drawn the same way by imshow. The
+    # steps are compared with a relative tolerance only, so coordinates
+    # in small units are not mistaken for regular ones.
+    steps = np.diff(vals)
+    if steps[0] <= 0 or not np.allclose(steps, steps[0], rtol=1e-5, atol=0):
+        return None
+
+    if vals.size == num_pixels + 1:
+        return vals[0], vals[-1]
+    elif vals.size == num_pixels:
+        half_step = 0.5 * steps[0]
+        return vals[0] - half_step, vals[-1] + half_step
+    return None
+
+
 def load_stylesheet(stylename='default'):
     """
     Load a custom style sheet.
@@ -99,6 +134,10 @@ def make_lookback_time_axis(ax, cosmology='Planck18', z_range=None, major_tick_s
     >>> ax2.set_xlabel('Lookback Time (Gyr)')
 
     """
+    # Astropy is slow to import, so only import it when an axis is made.
+    import astropy.units as apu
+    from pyx.cosmology import get_cosmology_from_name, _get_redshift_interpolators
+
     ax2 = ax.twiny()
 
     if cosmology is None:
@@ -113,8 +152,7 @@ def make_lookback_time_axis(ax, cosmology='Planck18', z_range=None, major_tick_s
         tick_locs = ax.xaxis.get_majorticklocs()
         z_min, z_max = tick_locs[0], tick_locs[-1]
 
-    lb_time_min = cosmology.lookback_time(z_min).value
-    lb_time_max = cosmology.lookback_time(z_max).value
+    lb_time_min, lb_time_max = cosmology.lookback_time([z_min, z_max]).to_value(apu.Gyr)
 
     lb_time_max_r = np.floor(lb_time_max / minor_tick_spacing) * minor_tick_spacing
     lb_time_min_r = np.ceil(lb_time_min / minor_tick_spacing) * minor_tick_spacing
@@ -126,46 +164,40 @@ def make_lookback_time_axis(ax, cosmology='Planck18', z_range=None, major_tick_s
         minor_tick_labels = np.arange(lb_time_min_r, lb_time_max_r + 1, minor_tick_spacing)
         major_tick_labels = np.arange(lb_time_min_r + 1, lb_time_max_r + 1, major_tick_spacing)
 
-    # Create empty tick location lists
-    major_tick_loc = np.zeros(len(major_tick_labels))
-    minor_tick_loc = np.zeros(len(minor_tick_labels))
-
-    # Calculate the position of the comoving distance Labels
-    # Need to split them up because they can be different length arrays
-    for idx, label in enumerate(major_tick_labels):
-        if label < 0.01: # If Lookbacktime is too small -> Redshift = 0
-            major_tick_loc[idx] = 0
-        else:
-            z_label = acosmo.z_at_value(cosmology.lookback_time, apu.Gyr * label)
-            # This correctly accounts for if the min _redshift > 0.
-            major_tick_loc[idx] = (z_label - z_min) / (z_max - z_min)
-
-    for idx, label in enumerate(minor_tick_labels):
-        if label < 0.01:
-            minor_tick_loc[idx] = 0
-        else:
-            z_label = acosmo.z_at_value(cosmology.lookback_time, apu.Gyr * label)
-            minor_tick_loc[idx] = (z_label - z_min) / (z_max - z_min)
+    # Find the redshift of every label at once by inverting the
+    # lookback time tabulated for this cosmology.
+    _, inverse_lookback_time = _get_redshift_interpolators(cosmology, "lookback_time", apu.Gyr)
+
+    # Calculate the position of the major and minor lookback time labels
+    # in one pass, then split them up again as they can be different
+    # length arrays.
+    # This correctly accounts for if the min _redshift > 0.
+    # If Lookbacktime is too small -> Redshift = 0
+    tick_labels = np.concatenate((major_tick_labels, minor_tick_labels))
+    tick_loc = np.where(tick_labels < 0.01, 0,
+        (inverse_lookback_time(tick_labels) - z_min) / (z_max - z_min))
+    major_tick_loc, minor_tick_loc = np.split(tick_loc, [len(major_tick_labels)])
 
     # Check if any tick_loc is larger than 1.0 and delete it if so:
     major_ticks_to_delete = np.where(major_tick_loc > 1)[0]
     minor_ticks_to_delete = np.where(minor_tick_loc > 1)[0]
 
     # Again splitting up because they can have different length arrays
+    # Keep the ticks before the first one to delete.
     if len(major_ticks_to_delete) > 0:
-        major_tick_loc = np.split(major_tick_loc, major_ticks_to_delete)[0]
-        major_tick_labels = np.split(major_tick_labels, major_ticks_to_delete)[0]
+        major_tick_loc = major_tick_loc[:major_ticks_to_delete[0]]
+        major_tick_labels = major_tick_labels[:major_ticks_to_delete[0]]
 
     if len(minor_ticks_to_delete) > 0:
-        minor_tick_loc = np.split(minor_tick_loc, minor_ticks_to_delete)[0]
-        minor_tick_labels = np.split(minor_tick_labels, minor_ticks_to_delete)[0]
+        minor_tick_loc = minor_tick_loc[:minor_ticks_to_delete[0]]
+        minor_tick_labels = minor_tick_labels[:minor_ticks_to_delete[0]]
 
     # Display the tick marks
     ax2.set_xticks(major_tick_loc)
     ax2.set_xticks(minor_tick_loc, minor=True)
 
     # Only put numbers on the major ticks
-    major_tick_labels = [f"{label:.0f}" for label in major_tick_labels]
+    major_tick_labels = np.char.mod("%.0f", major_tick_labels).tolist()
     ax2.set_xticklabels(major_tick_labels)
 
     return ax2
@@ -222,6 +254,10 @@ def make_comoving_distance_axis(ax, cosmology='Planck18', z_range=None,
     >>> ax2.set_xlabel('Comoving Distance (cMpc)')
 
     """
+    # Astropy is slow to import, so only import it when an axis is made.
+    import astropy.units as apu
+    from pyx.cosmology import get_cosmology_from_name, _get_redshift_interpolators
+
     ax2 = ax.twiny()
 
     if cosmology is None:
@@ -236,8 +272,7 @@ def make_comoving_distance_axis(ax, cosmology='Planck18', z_range=None,
         tick_locs = ax.xaxis.get_majorticklocs()
         z_min, z_max = tick_locs[0], tick_locs[-1]
 
-    dist_min = cosmology.comoving_distance(z_min).value
-    dist_max = cosmology.comoving_distance(z_max).value
+    dist_min, dist_max = cosmology.comoving_distance([z_min, z_max]).to_value(apu.Mpc)
 
     # Round the min/max distances based on tick_spacing
     dist_max_r = np.floor(dist_max / minor_tick_spacing) * minor_tick_spacing
@@ -257,46 +292,40 @@ def make_comoving_distance_axis(ax, cosmology='Planck18', z_range=None,
                                   major_max_label,
                                   major_tick_spacing)
 
-    # Create empty tick location lists
-    major_tick_loc = np.zeros(len(major_tick_labels))
-    minor_tick_loc = np.zeros(len(minor_tick_labels))
-
-    # Calculate the position of the comoving distance Labels
-    # Need to split them up because they can be different length arrays
-    for idx, label in enumerate(major_tick_labels):
-        if label < 0.01: # If Comoving Distance is too small -> Redshift = 0
-            major_tick_loc[idx] = 0
-        else:
-            z_label = acosmo.z_at_value(cosmology.comoving_distance, apu.Mpc * label)
-            # This correctly accounts for if the min _redshift > 0.
-            major_tick_loc[idx] = (z_label - z_min) / (z_max - z_min)
-
-    for idx, label in enumerate(minor_tick_labels):
-        if label < 0.01:
-            minor_tick_loc[idx] = 0
-        else:
-            z_label = acosmo.z_at_value(cosmology.comoving_distance, apu.Mpc * label)
-            minor_tick_loc[idx] = (z_label - z_min) / (z_max - z_min)
+    # Find the redshift of every label at once by inverting the
+    # comoving distance tabulated for this cosmology.
+    _, inverse_comoving_distance = _get_redshift_interpolators(cosmology, "comoving_distance", apu.Mpc)
+
+    # Calculate the position of the major and minor comoving distance labels
+    # in one pass, then split them up again as they can be different
+    # length arrays.
+    # This correctly accounts for if the min _redshift > 0.
+    # If Comoving Distance is too small -> Redshift = 0
+    tick_labels = np.concatenate((major_tick_labels, minor_tick_labels))
+    tick_loc = np.where(tick_labels < 0.01, 0,
+        (inverse_comoving_distance(tick_labels) - z_min) / (z_max - z_min))
+    major_tick_loc, minor_tick_loc = np.split(tick_loc, [len(major_tick_labels)])
 
     # Check if any tick_loc is larger than 1.0 and delete it if so:
     major_ticks_to_delete = np.where(major_tick_loc > 1)[0]
     minor_ticks_to_delete = np.where(minor_tick_loc > 1)[0]
 
     # Again splitting up because they can have different length arrays
+    # Keep the ticks before the first one to delete.
     if len(major_ticks_to_delete) > 0:
-        major_tick_loc = np.split(major_tick_loc, major_ticks_to_delete)[0]
-        major_tick_labels = np.split(major_tick_labels, major_ticks_to_delete)[0]
+        major_tick_loc = major_tick_loc[:major_ticks_to_delete[0]]
+        major_tick_labels = major_tick_labels[:major_ticks_to_delete[0]]
 
     if len(minor_ticks_to_delete) > 0:
-        minor_tick_loc = np.split(minor_tick_loc, minor_ticks_to_delete)[0]
-        minor_tick_labels = np.split(minor_tick_labels, minor_ticks_to_delete)[0]
+        minor_tick_loc = minor_tick_loc[:minor_ticks_to_delete[0]]
+        minor_tick_labels = minor_tick_labels[:minor_ticks_to_delete[0]]
 
     # Display the tick marks
     ax2.set_xticks(major_tick_loc)
     ax2.set_xticks(minor_tick_loc, minor=True)
 
     # Only put numbers on the major ticks
-    major_tick_labels = [f"{label:.0f}" for label in major_tick_labels]
+    major_tick_labels = np.char.mod("%.0f", major_tick_labels).tolist()
     ax2.set_xticklabels(major_tick_labels)
 
     return ax2
@@ -304,7 +333,7 @@ def make_comoving_distance_axis(ax, cosmology='Planck18', z_range=None,
 
 
 def pcolormesh2d(data, xvals=None, yvals=None, extents=None, ax=None, 
-    *args, **kwargs):
+    *args, use_imshow=False, **kwargs):
     """
     Plots a 2D array using pcolormesh.
 
@@ -314,6 +343,14 @@ def pcolormesh2d(data, xvals=None, yvals=None, extents=None, ax=None,
     Only provide xvals & yvals or provide an extents tuple, not both. 
     Additional args and kwargs are passed to the pcolormesh function.
 
+    With use_imshow=True, if the pixels are regularly spaced and
+    increasing, the axes are linear, and the only kwargs are ones imshow
+    also accepts (cmap, norm, vmin, vmax, alpha, ...), the array is
+    drawn with imshow instead, which is faster for large arrays. Unlike
+    pcolormesh, imshow sets the axis limits to the image extent, so
+    anything already on the axis outside the image is cut off and an
+    inverted axis is un-inverted.
+
     Parameters
     ----------
     data :
@@ -324,13 +361,21 @@ def pcolormesh2d(data, xvals=None, yvals=None, extents=None, ax=None,
 
     extents : (xmin, xmax, ymin, ymax), optional
 
-    passed_ax : plt.Axes or None, optional
+    ax : plt.Axes or None, optional
         If passed an an axis, the plotmis made on that axis instead.
+        If None, a new figure is created. It can be closed with
+        plt.close(im.figure) when plotting many arrays in a loop.
         Default: None
 
+    use_imshow : bool, optional
+        If True, draw a regular grid with imshow when it can be.
+        Default: False
+
     Returns
     -------
-    im : matplotlib.collections.QuadMesh
+    im : matplotlib.collections.QuadMesh or matplotlib.image.AxesImage
+        A QuadMesh, or an AxesImage if use_imshow is True and the
+        array is drawn with imshow.
         
     Examples
     --------
@@ -355,19 +400,35 @@ def pcolormesh2d(data, xvals=None, yvals=None, extents=None, ax=None,
 
     # If no axis is provided, create one.
     if ax is None:
-        fig = plt.figure()
-        ax = fig.add_subplot(111)
+        _, ax = plt.subplots(1, 1)
 
     # If extents are provided and not xvals and yvals.
     # Generate linearly spaced xvals and yvals.
-    if extents and not (xvals and yvals):
+    if extents is not None and xvals is None and yvals is None:
         xmin, xmax, ymin, ymax = extents
         yvals = np.linspace(ymin, ymax, data.shape[0])
         xvals = np.linspace(xmin, xmax, data.shape[1])
 
+    # A regular grid on linear axes can be drawn as a single image,
+    # which is much faster to draw than a quad for every pixel. Only
+    # take this path if imshow understands every argument.
+    use_imshow = (use_imshow and xvals is not None and yvals is not None and not args
+                  and _IMSHOW_SAFE_KWARGS.issuperset(kwargs)
+                  and ax.get_xscale() == "linear" and ax.get_yscale() == "linear")
+    if use_imshow:
+        x_edges = _regular_pixel_edges(xvals, np.shape(data)[1])
+        y_edges = _regular_pixel_edges(yvals, np.shape(data)[0])
+        if x_edges is not None and y_edges is not None:
+            # Keep the aspect of the axis, as pcolormesh does, rather
+            # than imshow's default from rcParams['image.aspect'].
+            im = ax.imshow(data, extent=(*x_edges, *y_edges), origin="lower",
+                           aspect=ax.get_aspect(), interpolation="nearest", **kwargs)
+            return im
+
+    # pcolormesh broadcasts 1D coordinates itself, so there is no need
+    # to build the full 2D grids with np.meshgrid.
     if xvals is not None and yvals is not None:
-        xx, yy = np.meshgrid(xvals, yvals)
-        im = ax.pcolormesh(xx, yy, data, *args, **kwargs)
+        im = ax.pcolormesh(xvals, yvals, data, *args, **kwargs)
 
     else:
         im = ax.pcolormesh(data, *args, **kwargs)
@@ -15,7 +15,6 @@ __all__ = [
     ]
 
 import numpy as np
-import scipy.interpolate as interpolate
 
 from pyx.utils import get_rng_from_seed
 
@@ -42,8 +41,8 @@ def bootstrap_resample(data, bootnum=100, num_samples=None, seed=None):
 
     Returns
     -------
-    boot :
-        An num_samples x bootnum array.
+    boot : np.ndarray
+        An bootnum x num_samples array with the same dtype as data.
 
     Example
     -------
@@ -59,12 +58,9 @@ def bootstrap_resample(data, bootnum=100, num_samples=None, seed=None):
     if num_samples is None:
         num_samples = len(data)
 
-    boot_dims = (bootnum, ) + (num_samples, )
-    boot = np.empty(boot_dims)
-
-    for i in range(bootnum):
-         boot_idx_arr = rng.integers(low=0, high=len(data), size=num_samples)
-         boot[i] = data[boot_idx_arr]
+    # Draw the indices of every resample in a single call.
+    boot_idx_arr = rng.integers(low=0, high=len(data), size=(bootnum, num_samples))
+    boot = np.asarray(data)[boot_idx_arr]
     return boot
 
 
@@ -101,9 +97,12 @@ def jackknife_resample(data):
     if not isinstance(data, np.ndarray):
         data = np.array(data)
 
-    resamples = np.empty([len(data), len(data) - 1])
-    for idx, _ in enumerate(data):
-        resamples[idx] = np.delete(data, idx)
+    # Gather every resample at once. Row i takes the indices 0..N-2,
+    # shifted up by one from column i onwards to skip the i-th point.
+    num_data = len(data)
+    cols = np.arange(num_data - 1)
+    resample_idx = cols + (cols >= np.arange(num_data)[:, np.newaxis])
+    resamples = data.astype(np.float64, copy=False)[resample_idx]
 
     return resamples
 
@@ -145,9 +144,27 @@ class InverseCDFSampler(object):
         self.y_input = yvals
         self.sample  = None
 
-        pdf_fnorm = np.sum(yvals)
-        self.cdf = np.cumsum(yvals / pdf_fnorm)
-        self.inverse_cdf = interpolate.interp1d(self.cdf, self.x_input)
+        # Normalise the cumulative sum in place by its last element,
+        # which is the sum of the pdf.
+        self.cdf = np.cumsum(yvals, dtype=np.float64)
+        self.cdf /= self.cdf[-1]
+
+    def inverse_cdf(self, r_values):
+        """
+        Linearly interpolates the inverse of the cdf.
+
+        Parameters
+        ----------
+        r_values : array-like
+            The cdf values, between cdf[0] and cdf[-1].
+
+        Returns
+        -------
+        x : np.ndarray
+            The x values where the cdf equals r_values.
+
+        """
+        return np.interp(r_values, self.cdf, self.x_input)
 
     def sample_n(self, n):
         """
@@ -165,6 +182,10 @@ class InverseCDFSampler(object):
             The samples array of length n.
 
         """
-        self.r_values = self.rng.uniform(self.cdf[0], self.cdf[-1], size=n)
+        # Scale uniform [0, 1) values onto [cdf[0], cdf[-1]) in place.
+        cdf_min = self.cdf[0]
+        self.r_values = self.rng.random(n)
+        self.r_values *= self.cdf[-1] - cdf_min
+        self.r_values += cdf_min
         self.sample = self.inverse_cdf(self.r_values)
         return self.sample
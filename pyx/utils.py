@@ -11,13 +11,34 @@ __all__ = [
     'files_with_prefix',
     'float2str', 
     'get_rng_from_seed',
-    'str2float'
-    'vprint'
+    'iter_files_with_stem',
+    'make_vprint',
+    'str2float',
+    'vprint',
     ]
 
+import fnmatch
+import functools
+import glob
+import itertools
+import operator
 import os
-import numpy as np
-from glob import glob
+import re
+import sys
+
+
+# Whether file names are compared with their case, as on POSIX systems.
+_CASE_SENSITIVE_NAMES = os.path.normcase("A") == "A"
+
+
+def _is_ndarray(obj):
+    """
+    Check if an object is a NumPy array without importing NumPy.
+
+    """
+    # An array can only exist if NumPy has already been imported.
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
 
 
 def files_with_stem(loc=".", prefix=None, suffix=None):
@@ -45,20 +66,124 @@ def files_with_stem(loc=".", prefix=None, suffix=None):
         A list of paths to all files in a directory.
 
     """
-    if suffix is None and prefix is None:
-        paths = glob(loc)
-    elif isinstance(suffix, str) and isinstance(prefix, str):
-        stem = "".join([prefix, "*", suffix])
-    elif isinstance(suffix, str) and prefix is None:
-        stem = "".join(["*", suffix])
-    elif suffix is None and isinstance(prefix, str):
-        stem = "".join([prefix, "*"])
+    _check_stem_types(prefix, suffix)
+
+    # Wildcards in loc, or a stem that reaches into subdirectories,
+    # need glob to expand the path.
+    if _stem_spans_directories(loc, prefix, suffix):
+        return sorted(glob.iglob(os.path.join(loc, f"{prefix or ''}*{suffix or ''}")))
+
+    # Every path starts with loc, so sorting by the file name gives the
+    # same order with shorter comparisons. The paths are joined to loc
+    # rather than taken from the entries, so they match glob's even for
+    # loc="" (which is listed as os.curdir).
+    names = sorted(entry.name for entry in iter_files_with_stem(loc, prefix, suffix))
+    return [os.path.join(loc, name) for name in names]
+
+
+def iter_files_with_stem(loc=".", prefix=None, suffix=None):
+    """
+    Iterate over all the files in a directory with a word stem
+    (either prefix and/or suffix) without building a list.
+
+    The files are yielded in the order the operating system lists
+    them, which is not sorted. Only a single directory is listed, so
+    unlike files_with_stem, loc can not contain wildcards and the
+    prefix and suffix can not contain a path separator.
+
+    Parameters
+    ----------
+    loc : str, optional
+        The path to the directory containing the files.
+        Default: "."
+    prefix : str, or None, optional
+        The prefix of the files to find. If None,
+        this will return all the files in the directory
+        regardless of prefix        
+    suffix : str, or None, optional
+        The suffix of the files to find. If None,
+        this will return all the files in the directory
+        regardless of suffix.
+
+    Yields
+    ------
+    entry : os.DirEntry
+        The directory entry of each file. The path to the file is
+        entry.path and the file name is entry.name.
+
+    """
+    _check_stem_types(prefix, suffix)
+    if _stem_spans_directories(loc, prefix, suffix):
+        msg = ("iter_files_with_stem only lists a single directory, so loc "
+               "can not contain wildcards and the prefix and suffix can not "
+               "contain a path separator. Use files_with_stem instead.")
+        raise ValueError(msg)
+
+    prefix = os.path.normcase(prefix or "")
+    suffix = os.path.normcase(suffix or "")
+    stem = f"{prefix}*{suffix}"
+
+    # Wildcards in the prefix or suffix need to be matched with a regex.
+    # Otherwise comparing the start and end of each name is faster.
+    if any(char in prefix or char in suffix for char in "*?["):
+        match = _compile_stem(stem)
     else:
-        msg = ("Suffix and Prefix both must have type None or str")
-        raise TypeError(msg)
+        match = None
+        min_length = len(prefix) + len(suffix)
+
+    # Like glob, hidden files only match a stem that starts with a '.'.
+    skip_hidden = not stem.startswith(".")
+
+    try:
+        entries = os.scandir(loc or os.curdir)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if skip_hidden and name.startswith("."):
+                continue
+            if not _CASE_SENSITIVE_NAMES:
+                name = os.path.normcase(name)
+            if match is None:
+                if len(name) >= min_length and name.startswith(prefix) and name.endswith(suffix):
+                    yield entry
+            elif match(name):
+                yield entry
+
+
+def _check_stem_types(prefix, suffix):
+    """
+    Check the prefix and suffix of a file stem are None or strings.
 
-    paths = glob(os.path.join(loc, stem))
-    return sorted(paths)
+    """
+    for word in (prefix, suffix):
+        if word is not None and not isinstance(word, str):
+            msg = ("Suffix and Prefix both must have type None or str")
+            raise TypeError(msg)
+
+
+def _stem_spans_directories(loc, prefix, suffix):
+    """
+    Check if the files matching a stem can be in more than one
+    directory, i.e. loc has wildcards or the prefix or suffix
+    contains a path separator.
+
+    """
+    separators = [sep for sep in (os.sep, os.altsep) if sep]
+    words = f"{prefix or ''}{suffix or ''}"
+    return (any(char in os.fspath(loc) for char in "*?[")
+            or any(sep in words for sep in separators))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_stem(stem):
+    """
+    Compile a shell-style stem into a regular expression match function.
+
+    """
+    return re.compile(fnmatch.translate(stem)).match
 
 
 def files_with_suffix(loc=".", suffix=None):
@@ -116,13 +241,16 @@ def float2str(flt, separator=".", precision=None, prefix=None, suffix=None):
 
     Parameters
     ----------
-    flt : float
-        The floating point number
+    flt : float or np.ndarray
+        The floating point number. An array of numbers is converted
+        into an array of strings with the same shape. A 0-d array is
+        converted like a single number.
     separator : str
         The symbol that will replace the decimal point in the float.
         Default: "."
     precision : int or None
         The number of decimal places of the float to use in the string.
+        If None, the number is written as str(flt).
         Default: None
     prefix : string or None
         Characters that are to appear at the beginning of the output.
@@ -133,8 +261,10 @@ def float2str(flt, separator=".", precision=None, prefix=None, suffix=None):
 
     Returns
     -------
-    string : str
-        A string representation of the floating point number.
+    string : str or np.ndarray
+        A string representation of the floating point number, or an
+        array of strings if an array of numbers (other than a 0-d
+        array) was given.
 
     Examples:
     ---------
@@ -156,27 +286,76 @@ def float2str(flt, separator=".", precision=None, prefix=None, suffix=None):
     'z23p5dex'
 
     """
-    if isinstance(precision, int):
+    if precision is not None:
+        int_precision = _as_int(precision)
+        if int_precision is None:
+            msg = f"precision must be an int or None, not {type(precision).__name__}"
+            raise TypeError(msg)
+        precision = int_precision
+
+    if _is_ndarray(flt) and flt.ndim > 0:
+        return _float2str_array(flt, separator=separator, precision=precision,
+                                prefix=prefix, suffix=suffix)
+
+    # Most calls only need the number itself, so skip the separator,
+    # prefix and suffix handling.
+    if separator == "." and prefix is None and suffix is None:
+        if precision is not None:
+            return f"{flt:.{precision}f}"
+        return str(flt)
+
+    if precision is not None:
         str_number = f"{flt:.{precision}f}"
     else:
         str_number = str(flt)
 
-    if separator!=".":
-        # Split number around the decimal point. 
-        number_parts = str_number.split(".")
-        string = separator.join(number_parts)
+    if separator != ".":
+        # Replace the decimal point with the separator.
+        string = str_number.replace(".", separator, 1)
     else:
         string = str_number
 
     if isinstance(prefix, str):
-        string = "".join([prefix, string])
+        string = f"{prefix}{string}"
 
     if isinstance(suffix, str):
-        string = "".join([string, suffix])
+        string = f"{string}{suffix}"
 
     return string
 
 
+def _float2str_array(flts, separator=".", precision=None, prefix=None, suffix=None):
+    """
+    Converts an array of numbers into an array of strings. See float2str.
+
+    """
+    import numpy as np
+
+    # Work out the format and the words once rather than for every
+    # number. Formatting Python floats is faster than np.char.mod.
+    format_spec = f".{precision}f" if precision is not None else ""
+    prefix = prefix if isinstance(prefix, str) else ""
+    suffix = suffix if isinstance(suffix, str) else ""
+
+    # Python floats and ints print the same as float64 and integer
+    # NumPy scalars but are faster to format. Other types, such as
+    # float32, are kept as NumPy scalars so they print the same as
+    # float2str of a single value.
+    if flts.dtype == np.float64 or flts.dtype.kind in "biu":
+        values = flts.ravel().tolist()
+    else:
+        values = list(flts.flat)
+
+    # Format the numbers the same way as float2str does for one value.
+    if format_spec:
+        numbers = map(format, values, itertools.repeat(format_spec))
+    else:
+        numbers = map(str, values)
+
+    strings = [f"{prefix}{number.replace('.', separator, 1)}{suffix}" for number in numbers]
+    return np.array(strings, dtype=str).reshape(flts.shape)
+
+
 def str2float(string, separator="p", prefix=None, suffix=None):
     """
     Converts a string into a floating point number.
@@ -187,8 +366,9 @@ def str2float(string, separator="p", prefix=None, suffix=None):
 
     Parameters
     ----------
-    string : str
-        The string containing the endoded float.
+    string : str or array-like of str
+        The string containing the endoded float. An array of strings
+        is converted into an array of floats with the same shape.
     separator : string
         The symbol that had replaced the decimal point in the float.
         Default: "p"
@@ -201,8 +381,9 @@ def str2float(string, separator="p", prefix=None, suffix=None):
 
     Returns
     -------
-    flt : float
-        A float extracted from the string representation.
+    flt : float or np.ndarray
+        A float extracted from the string representation, or an array
+        of floats if an array of strings was given.
 
     Examples:
     ---------
@@ -218,23 +399,45 @@ def str2float(string, separator="p", prefix=None, suffix=None):
     23.51
 
     """
+    if not isinstance(string, str):
+        return _str2float_array(string, separator=separator, prefix=prefix, suffix=suffix)
+
     if prefix is not None:
         string = string.removeprefix(prefix)
     if suffix is not None: 
         string = string.removesuffix(suffix)
-    if separator is not None:
-        values = string.split(separator)
-
-    # This line is a little funky but its a clever way to recombine
-    # the two sides of the decimal.
-    # e.g [25, 555] = 25 + 555/(10**3)
-    if len(values) > 1:
-        flt = int(values[0]) + int(values[1])/(10**len(values[1]))
-    else:
-        flt = int(values[0])
+    # Put the decimal point back and let float parse the number.
+    if separator is not None and separator != ".":
+        string = string.replace(separator, ".")
+    flt = float(string)
     return flt
 
 
+def _str2float_array(strings, separator="p", prefix=None, suffix=None):
+    """
+    Converts an array of strings into an array of floats. See str2float.
+
+    """
+    import numpy as np
+
+    # Python strings are faster to work with than NumPy strings.
+    strings = np.asarray(strings)
+    shape = strings.shape
+    strings = strings.ravel().tolist()
+
+    # Empty words leave the strings unchanged, so the loop does not
+    # need to check the arguments for every string.
+    prefix = prefix or ""
+    suffix = suffix or ""
+    separator = separator or "."
+
+    flts = np.fromiter(
+        (float(string.removeprefix(prefix).removesuffix(suffix).replace(separator, "."))
+         for string in strings),
+        dtype=np.float64, count=len(strings))
+    return flts.reshape(shape)
+
+
 
 def get_rng_from_seed(seed):
     """
@@ -250,15 +453,66 @@ def get_rng_from_seed(seed):
     rng : np.random.default_rng
 
     """
+    # NumPy is only imported when it is needed, so the string and file
+    # utilities can be used without the cost of importing it.
+    import numpy as np
+
     if seed is None:
         rng = np.random.default_rng()
-    elif isinstance(seed, int):
+    elif _as_int(seed) is not None:
         rng = np.random.default_rng(seed=seed)
     else:
         raise ValueError("Seed must be of type int")
     return rng  
 
 
+def _as_int(value):
+    """
+    Get an integer, such as an int or NumPy integer, as an int.
+    Returns None for anything else, including bools.
+
+    """
+    if isinstance(value, bool):
+        return None
+    try:
+        return operator.index(value)
+    except TypeError:
+        return None
+
+
+def _do_nothing(*args, **kwargs):
+    pass
+
+
+def make_vprint(verbose=True):
+    """
+    Makes a print function that either prints or does nothing.
+
+    Unlike vprint, the verbose check is only made once, so this is
+    better suited to printing inside a loop.
+
+    Parameters
+    ----------
+    verbose : bool, optional
+        If True, returns the regular print function. If False, returns
+        a function that skips the print statement entirely.
+        Default: True
+
+    Returns
+    -------
+    vprint : function
+        The print function.
+
+    Example
+    -------
+    >>> vp = make_vprint(verbose=False)
+    >>> for i in range(10):
+    ...     vp(i)
+
+    """
+    return print if verbose else _do_nothing
+
+
 def vprint(*args, verbose=True, **kwargs):
     """
     Behaves exactly the same as the regular print function except
@@ -165,3 +165,125 @@ def test_scale_factor_with_arrays():
 
     assert np.isclose(true_a_array, scale_factors).all()
 
+
+
+def test_cMpc_to_z_array_matches_z_at_value():
+    """
+    Test the interpolated redshifts match those found by astropy's
+    z_at_value over a wide range of distances.
+
+    """
+    P15 = acosmo.Planck15
+    comoving_distance_array = np.array([1.0, 100.0, 1000.0, 5000.0, 10000.0])
+    expected_redshift_array = np.array([
+        acosmo.z_at_value(P15.comoving_distance, dist * apu.Mpc).value
+        for dist in comoving_distance_array
+    ])
+    calculated_redshift_array = pyxcosmo.cMpc_to_z(comoving_distance_array, cosmology='Planck15')
+    assert np.allclose(expected_redshift_array, calculated_redshift_array.value)
+
+
+def test_scale_factor_with_out_array():
+    """
+    Test that the scale factor is written into a provided array.
+    """
+    redshift = np.array([0.0, 1.0, 2.0, 3.0])
+    out = np.empty_like(redshift)
+    scale_factors = pyxcosmo.scale_factor(redshift, out=out)
+
+    assert scale_factors is out
+    assert np.allclose(np.array([1, 1/2, 1/3, 1/4]), out)
+
+
+def test_z_to_cMpc_array_matches_astropy():
+    """
+    Test the interpolated distances match astropy's comoving distance
+    over a wide range of redshifts, including beyond the tabulated range.
+
+    """
+    P15 = acosmo.Planck15
+    redshift_array = np.array([0.01, 0.5, 3.0, 50.0, 2000.0])
+    expected_distance_array = P15.comoving_distance(redshift_array).value
+    calculated_distance_array = pyxcosmo.z_to_cMpc(redshift_array, cosmology='Planck15').value
+    assert np.allclose(expected_distance_array, calculated_distance_array)
+
+
+def test_scale_factor_with_dtype():
+    """
+    Test that the scale factor can be returned as float32.
+    """
+    redshift = np.array([0, 1, 2, 3])
+    scale_factors = pyxcosmo.scale_factor(redshift, dtype=np.float32)
+
+    assert scale_factors.dtype == np.float32
+    assert np.allclose(np.array([1, 1/2, 1/3, 1/4]), scale_factors)
+
+
+def test_z_to_cMpc_large_array_matches_astropy():
+    """
+    Test distances interpolated from the tabulated cosmology match
+    astropy's comoving distance.
+
+    """
+    P15 = acosmo.Planck15
+    redshift_array = np.linspace(0, 20, 500)
+    expected_distance_array = P15.comoving_distance(redshift_array).value
+    calculated_distance_array = pyxcosmo.z_to_cMpc(redshift_array, cosmology='Planck15').value
+    assert np.allclose(expected_distance_array, calculated_distance_array)
+
+
+def test_z_to_cMpc_scalar_does_not_tabulate():
+    """
+    Test a scalar redshift with a new cosmology is calculated directly
+    without tabulating the cosmology.
+
+    """
+    cosmo = acosmo.FlatLambdaCDM(H0=71.3, Om0=0.29)
+    distance = pyxcosmo.z_to_cMpc(2.0, cosmology=cosmo)
+
+    key = pyxcosmo._redshift_interpolator_key(cosmo, "comoving_distance", apu.Mpc)
+    assert key not in pyxcosmo._REDSHIFT_INTERPOLATORS
+    assert np.isclose(distance.value, cosmo.comoving_distance(2.0).value)
+
+
+def test_redshift_interpolators_cache_is_bounded():
+    """
+    Test only the most recently used cosmologies are kept tabulated.
+
+    """
+    for H0 in np.linspace(60, 80, pyxcosmo._MAX_REDSHIFT_INTERPOLATORS + 3):
+        cosmo = acosmo.FlatLambdaCDM(H0=H0, Om0=0.3)
+        pyxcosmo._get_redshift_interpolators(cosmo)
+
+    assert len(pyxcosmo._REDSHIFT_INTERPOLATORS) == pyxcosmo._MAX_REDSHIFT_INTERPOLATORS
+    key = pyxcosmo._redshift_interpolator_key(cosmo, "comoving_distance", apu.Mpc)
+    assert key in pyxcosmo._REDSHIFT_INTERPOLATORS
+
+
+def test_cMpc_to_z_beyond_table():
+    """
+    Test distances beyond the tabulated redshifts are still converted,
+    and distances that are too large raise a ValueError.
+
+    """
+    redshift = pyxcosmo.cMpc_to_z(14000, cosmology='Planck18')
+    distance = acosmo.Planck18.comoving_distance(redshift.value).value
+    assert redshift.value > 1000
+    assert np.isclose(distance, 14000)
+
+    with pytest.raises(ValueError):
+        pyxcosmo.cMpc_to_z(20000, cosmology='Planck18')
+
+
+def test_cMpc_to_z_scalar_does_not_tabulate():
+    """
+    Test a scalar distance with a new cosmology is solved directly
+    without tabulating the cosmology.
+
+    """
+    cosmo = acosmo.FlatLambdaCDM(H0=68.7, Om0=0.31)
+    redshift = pyxcosmo.cMpc_to_z(1000.0, cosmology=cosmo)
+
+    key = pyxcosmo._redshift_interpolator_key(cosmo, "comoving_distance", apu.Mpc)
+    assert key not in pyxcosmo._REDSHIFT_INTERPOLATORS
+    assert np.isclose(cosmo.comoving_distance(redshift.value).value, 1000.0)
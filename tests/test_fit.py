@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from pyx import fit as pyxfit
+
+
+def test_fit_straight_line_least_squares_exact_line():
+    """
+    Test fitting a straight line to points that lie exactly on a line
+    returns the intercept and slope of that line.
+
+    """
+    xvals = np.linspace(0, 10, 20)
+    yvals = 3.0 + 2.0 * xvals
+    yerr = np.ones(len(xvals))
+    best_fit, uncerts, chisq, redchisq = pyxfit.fit_straight_line_least_squares(xvals, yvals, yerr)
+    assert np.allclose(best_fit, [3.0, 2.0])
+    assert np.isclose(chisq, 0.0)
+
+
+def test_fit_poly_least_squares_matches_normal_equations():
+    """
+    Test the polynomial fit matches the explicit matrix solution in
+    Hogg+2010 with a dense covariance matrix.
+
+    """
+    rng = np.random.default_rng(seed=12345)
+    xvals = np.linspace(0, 5, 50)
+    yerr = rng.uniform(0.1, 1.0, len(xvals))
+    yvals = 1.0 + 2.0 * xvals - 0.3 * xvals**2 + rng.normal(0, yerr)
+
+    A = np.vander(xvals, 3, increasing=True)
+    Cinv = np.linalg.inv(np.diag(yerr * yerr))
+    cov = np.linalg.inv(A.T @ Cinv @ A)
+    expected_fit = cov @ A.T @ Cinv @ yvals
+    expected_uncerts = np.sqrt(np.diag(cov))
+
+    best_fit, uncerts, chisq, redchisq = pyxfit.fit_poly_least_squares(xvals, yvals, yerr, order=2)
+    assert np.allclose(expected_fit, best_fit)
+    assert np.allclose(expected_uncerts, uncerts)
+    assert np.isclose(redchisq, chisq / (len(xvals) - 3))
@@ -0,0 +1,53 @@
+import io
+
+import numpy as np
+import pytest
+
+from pyx import io as pyxio
+
+
+def test_write_row_floats():
+    """
+    Test a row of numbers is written with fixed width columns.
+
+    """
+    output = io.StringIO()
+    pyxio.write_row(output, [1, 2.5, 3], col_width=8, decimals=2)
+    assert output.getvalue() == "1.00    2.50    3.00    \n"
+
+
+def test_write_row_strings():
+    """
+    Test a row of strings is written with fixed width columns.
+
+    """
+    output = io.StringIO()
+    pyxio.write_row(output, ["a", "bc"], col_width=4)
+    assert output.getvalue() == "a   bc  \n"
+
+
+def test_dict_to_hdf5_group(tmp_path):
+    """
+    Test a dictionary is written as the attributes of a new group.
+
+    """
+    h5py = pytest.importorskip("h5py")
+    attrs_dict = {"b": 1, "a": np.arange(3), "c": "text"}
+    with h5py.File(tmp_path / "test.hdf5", "w") as hdf5_file:
+        pyxio.dict_to_hdf5_group(hdf5_file, attrs_dict, "group")
+        attrs = hdf5_file["group"].attrs
+        assert sorted(attrs.keys()) == ["a", "b", "c"]
+        assert attrs["b"] == 1
+        assert np.array_equal(attrs["a"], np.arange(3))
+        assert attrs["c"] == "text"
+
+
+def test_load_yaml(tmp_path):
+    """
+    Test a YAML file is loaded into a dictionary.
+
+    """
+    path = tmp_path / "config.yaml"
+    path.write_text("name: test\nvalues:\n  - 1\n  - 2.5\nflag: true\n")
+    data = pyxio.load_yaml(path)
+    assert data == {"name": "test", "values": [1, 2.5], "flag": True}
@@ -53,3 +53,161 @@ def test_reshape_to_1D_3D_array():
                                       1, 2, 3, 4, 5, 6, 7, 8, 9])
     reshaped_array = pyxmaths.reshape_to_1D(test_array)
     assert np.allclose(expected_output_array, reshaped_array)
+
+
+def test_rebin1d_divisible():
+    """
+    Test rebinning an array whose length is divisible by bin_size.
+
+    """
+    test_array = np.array([1, 2, 3, 4, 5, 6])
+    expected_output_array = np.array([3, 7, 11])
+    rebinned_array = pyxmaths.rebin1d(test_array, 2)
+    assert np.allclose(expected_output_array, rebinned_array)
+
+
+def test_rebin1d_remainder():
+    """
+    Test rebinning an array whose length is not divisible by bin_size
+    leaves off the remaining bins.
+
+    """
+    test_array = np.array([1, 2, 3, 4, 5, 6, 7])
+    expected_output_array = np.array([6, 15])
+    rebinned_array = pyxmaths.rebin1d(test_array, 3)
+    assert np.allclose(expected_output_array, rebinned_array)
+
+
+def test_pdf_percentile_uniform():
+    """
+    Test the percentiles of a uniform PDF are evenly spaced.
+
+    """
+    x = np.linspace(0, 10, 11)
+    pdf = np.ones(len(x))
+    percentiles = pyxmaths.pdf_percentile(x, pdf, np.array([0.25, 0.5, 0.75]))
+    assert np.allclose(np.array([1.75, 4.5, 7.25]), percentiles)
+    assert np.isclose(pyxmaths.pdf_median(x, pdf), 4.5)
+
+
+@pytest.mark.parametrize("mode", ["full", "same", "valid"])
+@pytest.mark.parametrize("w", [3, 50])
+def test_moving_mean_matches_convolve(mode, w):
+    """
+    Test the moving mean matches the convolution with a window of ones
+    for both narrow and wide windows.
+
+    """
+    rng = np.random.default_rng(seed=12345)
+    x = rng.normal(size=200)
+    expected_output_array = np.convolve(x, np.ones(w), mode=mode) / w
+    assert np.allclose(expected_output_array, pyxmaths.moving_mean(x, w, mode=mode))
+
+
+def test_moving_mean_complex():
+    """
+    Test the moving mean of complex values keeps the imaginary part
+    for wide windows.
+
+    """
+    x = np.ones(40) * (1 + 1j)
+    assert np.allclose(pyxmaths.moving_mean(x, 20, mode='valid'), 1 + 1j)
+
+
+def test_moving_mean_nan_only_affects_overlapping_windows():
+    """
+    Test a NaN in the input only gives NaN for the windows that
+    contain it, as with the convolution.
+
+    """
+    x = np.arange(100.)
+    x[5] = np.nan
+    expected_output_array = np.convolve(x, np.ones(16), mode='valid') / 16
+    moving_avg = pyxmaths.moving_mean(x, 16, mode='valid')
+    assert np.sum(np.isnan(moving_avg)) == 6
+    assert np.allclose(expected_output_array, moving_avg, equal_nan=True)
+
+
+def test_deg2rad_rad2deg_round_trip():
+    """
+    Test converting degrees to radians and back returns the input.
+
+    """
+    degrees = np.array([0.0, 45.0, 90.0, 180.0, 270.0])
+    assert np.allclose(np.array([0, np.pi/4, np.pi/2, np.pi, 3*np.pi/2]), pyxmaths.deg2rad(degrees))
+    assert np.allclose(degrees, pyxmaths.rad2deg(pyxmaths.deg2rad(degrees)))
+
+
+def test_angle_of_line_through_points_arrays():
+    """
+    Test the angles of many lines can be calculated at once.
+
+    """
+    xvals = np.array([1.0, 0.0, -1.0])
+    yvals = np.array([1.0, 1.0, 0.0])
+    angles = pyxmaths.angle_of_line_through_points((xvals, yvals))
+    assert np.allclose(np.array([45.0, 90.0, 180.0]), angles)
+    assert np.isclose(pyxmaths.angle_of_line_through_points((1.0, 1.0), axis='y', units='rad'), np.pi/4)
+
+
+def test_hist_pdf_normalised():
+    """
+    Test the PDF of a histogram integrates to one, and an empty
+    histogram gives a PDF of zeros.
+
+    """
+    hist, edges = np.histogram([0.1, 0.2, 0.2, 0.7, 1.5], bins=[0, 0.5, 1.0, 2.0])
+    pdf = pyxmaths.hist_pdf(hist, np.diff(edges))
+    assert np.isclose(np.sum(pdf * np.diff(edges)), 1.0)
+
+    empty_pdf = pyxmaths.hist_pdf(np.zeros(3, dtype=int), np.diff(edges))
+    assert empty_pdf.dtype == np.float64
+    assert np.allclose(np.zeros(3), empty_pdf)
+
+
+def test_linspace_angles_wraps_through_zero():
+    """
+    Test angles spanning zero degrees wrap around the rotation.
+
+    """
+    samples = pyxmaths.linspace_angles(330, 30, num=5)
+    assert np.allclose(np.array([330, 345, 0, 15, 30]), samples)
+
+
+def test_bin_centres():
+    """
+    Test the bin centres are the midpoints of uneven bin edges.
+
+    """
+    bin_edges = np.array([0.0, 1.0, 3.0, 7.0])
+    assert np.allclose(np.array([0.5, 2.0, 5.0]), pyxmaths.bin_centres(bin_edges))
+
+
+def test_pdf_mean_var_std_gaussian():
+    """
+    Test the moments of a sampled Gaussian PDF.
+
+    """
+    x = np.linspace(-10, 10, 2001)
+    dx = x[1] - x[0]
+    pdf = np.exp(-0.5 * ((x - 1.0) / 2.0)**2) / (2.0 * np.sqrt(2 * np.pi))
+    assert np.isclose(pyxmaths.pdf_mean(x, pdf, dx), 1.0, atol=1e-3)
+    assert np.isclose(pyxmaths.pdf_var(x, pdf, dx), 4.0, atol=1e-2)
+    assert np.isclose(pyxmaths.pdf_std(x, pdf, dx), 2.0, atol=1e-2)
+
+
+def test_linearly_interpolate_pdfs_many_samples():
+    """
+    Test interpolating PDFs for an array of samples gives one row per
+    sample that matches interpolating each sample individually.
+
+    """
+    pdf1 = np.array([0.0, 1.0, 2.0])
+    pdf2 = np.array([2.0, 1.0, 0.0])
+    samples = np.array([1.0, 1.5, 2.0])
+    interp_pdfs = pyxmaths.linearly_interpolate_pdfs(samples, (1.0, 2.0), (pdf1, pdf2))
+
+    assert interp_pdfs.shape == (3, 3)
+    assert np.allclose(np.array([1.0, 1.0, 1.0]), interp_pdfs[1])
+    for sample, interp_pdf in zip(samples, interp_pdfs):
+        assert np.allclose(pyxmaths.linearly_interpolate_pdfs(sample, (1.0, 2.0), (pdf1, pdf2)), interp_pdf)
@@ -0,0 +1,191 @@
+import numpy as np
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import astropy.units as apu
+import astropy.cosmology as acosmo
+
+from pyx import plots as pyxplots
+
+
+def test_make_comoving_distance_axis_tick_locations():
+    """
+    Test the major ticks are placed at the redshift of their
+    comoving distance label.
+
+    """
+    fig, ax = plt.subplots(1, 1)
+    ax2 = pyxplots.make_comoving_distance_axis(ax, cosmology='Planck15', z_range=(0, 6))
+    tick_locs = ax2.get_xticks()
+    tick_labels = [float(label.get_text()) for label in ax2.get_xticklabels()]
+    plt.close(fig)
+
+    expected_locs = [
+        0.0 if label < 0.01 else
+        acosmo.z_at_value(acosmo.Planck15.comoving_distance, label * apu.Mpc).value / 6
+        for label in tick_labels
+    ]
+    assert np.allclose(expected_locs, tick_locs)
+
+
+def test_make_lookback_time_axis_tick_locations():
+    """
+    Test the major ticks are placed at the redshift of their
+    lookback time label.
+
+    """
+    fig, ax = plt.subplots(1, 1)
+    ax2 = pyxplots.make_lookback_time_axis(ax, cosmology='Planck15', z_range=(0, 6))
+    tick_locs = ax2.get_xticks()
+    tick_labels = [float(label.get_text()) for label in ax2.get_xticklabels()]
+    plt.close(fig)
+
+    expected_locs = [
+        0.0 if label < 0.01 else
+        acosmo.z_at_value(acosmo.Planck15.lookback_time, label * apu.Gyr).value / 6
+        for label in tick_labels
+    ]
+    assert np.allclose(expected_locs, tick_locs)
+
+
+def test_pcolormesh2d_regular_grid_uses_image():
+    """
+    Test a regularly spaced grid is drawn as an image covering the
+    same area as the pixels would with pcolormesh when asked to.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    fig, ax = plt.subplots(1, 1)
+    im = pyxplots.pcolormesh2d(data, extents=(0, 3, 0, 2), ax=ax, use_imshow=True)
+    plt.close(fig)
+
+    assert isinstance(im, matplotlib.image.AxesImage)
+    assert np.allclose(im.get_extent(), (-0.5, 3.5, -0.5, 2.5))
+
+
+def test_pcolormesh2d_irregular_grid_uses_pcolormesh():
+    """
+    Test an irregularly spaced grid is still drawn with pcolormesh.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    xvals = 2.0**np.arange(4)
+    yvals = 2.0**np.arange(3)
+    fig, ax = plt.subplots(1, 1)
+    im = pyxplots.pcolormesh2d(data, xvals=xvals, yvals=yvals, ax=ax)
+    plt.close(fig)
+
+    assert isinstance(im, matplotlib.collections.QuadMesh)
+
+
+def test_load_stylesheet_unknown_name():
+    """
+    Test loading a style sheet that does not exist raises a ValueError.
+
+    """
+    assert "default" in pyxplots._available_stylesheets()
+    with pytest.raises(ValueError):
+        pyxplots.load_stylesheet("not_a_stylesheet")
+
+
+def test_pcolormesh2d_array_coordinates():
+    """
+    Test xvals and yvals can be given as arrays alongside extents.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    xvals = 2.0**np.arange(4)
+    yvals = 2.0**np.arange(3)
+    fig, ax = plt.subplots(1, 1)
+    im = pyxplots.pcolormesh2d(data, xvals=xvals, yvals=yvals, extents=(0, 1, 0, 1), ax=ax)
+    plt.close(fig)
+
+    assert isinstance(im, matplotlib.collections.QuadMesh)
+
+
+def test_pcolormesh2d_pcolormesh_kwargs():
+    """
+    Test kwargs that only pcolormesh accepts still work on a regular grid.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    fig, ax = plt.subplots(1, 1)
+    im = pyxplots.pcolormesh2d(data, extents=(0, 1, 0, 1), ax=ax, use_imshow=True,
+                               edgecolors='k', linewidth=0.5, antialiased=True)
+    plt.close(fig)
+
+    assert isinstance(im, matplotlib.collections.QuadMesh)
+
+
+def test_pcolormesh2d_keeps_aspect():
+    """
+    Test drawing a regular grid does not change the aspect of the axis.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax2.set_aspect('equal')
+    im1 = pyxplots.pcolormesh2d(data, extents=(0, 3, 0, 2), ax=ax1, use_imshow=True)
+    im2 = pyxplots.pcolormesh2d(data, extents=(0, 3, 0, 2), ax=ax2, use_imshow=True, cmap='viridis')
+    plt.close(fig)
+
+    assert isinstance(im1, matplotlib.image.AxesImage)
+    assert isinstance(im2, matplotlib.image.AxesImage)
+    assert ax1.get_aspect() == 'auto'
+    assert ax2.get_aspect() == 1.0
+
+
+def test_pcolormesh2d_decreasing_and_log_axes():
+    """
+    Test decreasing coordinates and log axes are drawn with pcolormesh.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    im1 = pyxplots.pcolormesh2d(data, xvals=np.arange(4.), yvals=np.arange(3.)[::-1], ax=ax1,
+                                use_imshow=True)
+    ax2.set_xscale('log')
+    im2 = pyxplots.pcolormesh2d(data, xvals=np.arange(1., 5.), yvals=np.arange(3.), ax=ax2,
+                                use_imshow=True)
+    plt.close(fig)
+
+    assert isinstance(im1, matplotlib.collections.QuadMesh)
+    assert np.allclose(ax1.get_ylim(), (-0.5, 2.5))
+    assert isinstance(im2, matplotlib.collections.QuadMesh)
+
+
+def test_pcolormesh2d_keeps_existing_limits():
+    """
+    Test drawing a regular grid by default keeps the limits of what is
+    already on the axis, and keeps an inverted axis inverted.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax1.plot([0, 10], [0, 10])
+    im1 = pyxplots.pcolormesh2d(data, extents=(0, 3, 0, 2), ax=ax1)
+    ax2.invert_yaxis()
+    im2 = pyxplots.pcolormesh2d(data, extents=(0, 3, 0, 2), ax=ax2)
+    plt.close(fig)
+
+    assert isinstance(im1, matplotlib.collections.QuadMesh)
+    assert ax1.get_xlim()[1] > 10
+    assert isinstance(im2, matplotlib.collections.QuadMesh)
+    assert np.allclose(ax2.get_ylim(), (2.5, -0.5))
+
+
+def test_pcolormesh2d_small_irregular_steps_use_pcolormesh():
+    """
+    Test irregular coordinates in small units are not drawn as an image.
+
+    """
+    data = np.arange(12).reshape(3, 4)
+    xvals = np.array([0, 1e-10, 5e-10, 2e-9])
+    fig, ax = plt.subplots(1, 1)
+    im = pyxplots.pcolormesh2d(data, xvals=xvals, yvals=np.arange(3.), ax=ax, use_imshow=True)
+    plt.close(fig)
+
+    assert pyxplots._regular_pixel_edges(xvals, 4) is None
+    assert isinstance(im, matplotlib.collections.QuadMesh)
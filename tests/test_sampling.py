@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from pyx import sampling as pyxsampling
+
+
+def test_jackknife_resample():
+    """
+    Test the i-th jackknife resample is the data without the i-th point.
+
+    """
+    data = np.array([1, 2, 3, 4, 5])
+    resamples = pyxsampling.jackknife_resample(data)
+
+    expected = np.array([np.delete(data, idx) for idx in range(len(data))])
+    assert resamples.shape == (5, 4)
+    assert np.array_equal(resamples, expected)
+
+
+def test_bootstrap_resample_shape():
+    """
+    Test the bootstrap resamples have the requested shape and only
+    contain values from the data.
+
+    """
+    data = np.arange(10)
+    boot = pyxsampling.bootstrap_resample(data, bootnum=20, num_samples=5, seed=1)
+
+    assert boot.shape == (20, 5)
+    assert np.all(np.isin(boot, data))
+
+
+def test_bootstrap_resample_seed():
+    """
+    Test the same seed gives the same bootstrap resamples.
+
+    """
+    data = np.arange(10)
+    boot1 = pyxsampling.bootstrap_resample(data, seed=123)
+    boot2 = pyxsampling.bootstrap_resample(data, seed=123)
+    assert np.array_equal(boot1, boot2)
+
+
+def test_inverse_cdf_sampler_range():
+    """
+    Test the inverse cdf samples lie within the x values with a
+    non-zero probability.
+
+    """
+    xvals = np.linspace(0, 10, 101)
+    yvals = np.where((xvals > 2) & (xvals < 4), 1.0, 0.0)
+    sampler = pyxsampling.InverseCDFSampler(xvals, yvals, seed=42)
+    samples = sampler.sample_n(1000)
+
+    assert samples.shape == (1000,)
+    assert np.all((samples >= 2) & (samples <= 4))
+
+
+def test_inverse_cdf_sampler_cdf():
+    """
+    Test the cdf of the sampler is normalised.
+
+    """
+    sampler = pyxsampling.InverseCDFSampler(np.arange(4), np.array([1, 2, 3, 4]))
+    assert np.allclose(sampler.cdf, [0.1, 0.3, 0.6, 1.0])
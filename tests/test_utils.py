@@ -1,50 +1,154 @@
+import os
+
 import numpy as np
 import pytest
 
 from pyx import utils as pyxutils
 
-def test_float2str_int():
-    assert pyxutils.float2str(23) == '23'
-
-def test_float2str_float():
-    assert pyxutils.float2str(23.5) == '23.5'
-
-def test_float2str_float_separator():
-    assert pyxutils.float2str(23.5, separator="p") == '23p5'
-
-def test_float2str_float_precision_lower():
-    assert pyxutils.float2str(23.5, precision=4) == '23.5000'
-
-def test_float2str_float_precision_higher():
-    assert pyxutils.float2str(23.501345, precision=4) == '23.5013'
-
-def test_float2str_float_precision_zero():
-    assert pyxutils.float2str(23.5, precision=0) == '24'
-
-def test_float2str_prefix_separator():
-    assert pyxutils.float2str(23.5, prefix='z', separator='p') == 'z23p5'
+@pytest.mark.parametrize("flt, kwargs, expected", [
+    (23, {}, '23'),
+    (23.5, {}, '23.5'),
+    (23.5, {"separator": "p"}, '23p5'),
+    (23.5, {"precision": 4}, '23.5000'),
+    (23.501345, {"precision": 4}, '23.5013'),
+    (23.5, {"precision": 0}, '24'),
+    (23.5, {"prefix": "z", "separator": "p"}, 'z23p5'),
+    (23.5, {"prefix": "z", "separator": "p", "suffix": "dex"}, 'z23p5dex'),
+])
+def test_float2str(flt, kwargs, expected):
+    assert pyxutils.float2str(flt, **kwargs) == expected
+
+@pytest.mark.parametrize("string, kwargs, expected", [
+    ('23', {}, 23),
+    ('23p5', {}, 23.5),
+    ('23p51234', {}, 23.51234),
+    ('23_5', {"separator": "_"}, 23.5),
+    ('z23p5', {"prefix": "z", "separator": "p"}, 23.5),
+    ('z23_5dex', {"prefix": "z", "separator": "_", "suffix": "dex"}, 23.5),
+    ('z23_51234dex', {"prefix": "z", "separator": "_", "suffix": "dex"}, 23.51234),
+])
+def test_str2float(string, kwargs, expected):
+    assert pyxutils.str2float(string, **kwargs) == pytest.approx(expected)
+
+def test_files_with_stem(tmp_path):
+    for name in ["b_1.txt", "a_2.txt", "a_1.dat"]:
+        (tmp_path / name).touch()
+
+    def names(paths):
+        return [os.path.basename(path) for path in paths]
+
+    assert names(pyxutils.files_with_stem(tmp_path)) == ["a_1.dat", "a_2.txt", "b_1.txt"]
+    assert names(pyxutils.files_with_suffix(tmp_path, suffix=".txt")) == ["a_2.txt", "b_1.txt"]
+    assert names(pyxutils.files_with_prefix(tmp_path, prefix="a_")) == ["a_1.dat", "a_2.txt"]
+    assert names(pyxutils.files_with_stem(tmp_path, prefix="a_", suffix=".txt")) == ["a_2.txt"]
+
+def test_files_with_stem_invalid_type():
+    with pytest.raises(TypeError):
+        pyxutils.files_with_stem(".", suffix=1)
+
+def test_files_with_stem_hidden_and_missing(tmp_path):
+    for name in [".hidden.txt", "a_1.txt"]:
+        (tmp_path / name).touch()
+
+    def names(paths):
+        return [os.path.basename(path) for path in paths]
+
+    assert names(pyxutils.files_with_stem(tmp_path)) == ["a_1.txt"]
+    assert names(pyxutils.files_with_prefix(tmp_path, prefix=".")) == [".hidden.txt"]
+    assert pyxutils.files_with_stem(tmp_path / "missing") == []
+
+def test_str2float_negative():
+    assert pyxutils.str2float('-23p5') == -23.5
+
+def test_str2float_array():
+    strings = ['z23p5dex', 'z1p25dex', 'z0dex']
+    flts = pyxutils.str2float(strings, prefix='z', suffix='dex')
+    assert np.array_equal(flts, [23.5, 1.25, 0.0])
+
+    flts = pyxutils.str2float([['1p5'], ['2p5']])
+    assert flts.shape == (2, 1)
+    assert np.array_equal(flts, [[1.5], [2.5]])
+
+def test_all_names_exist():
+    for name in pyxutils.__all__:
+        assert hasattr(pyxutils, name)
+
+def test_make_vprint(capsys):
+    pyxutils.make_vprint(verbose=True)("shown")
+    pyxutils.make_vprint(verbose=False)("hidden")
+    assert capsys.readouterr().out == "shown\n"
+
+def test_iter_files_with_stem(tmp_path):
+    for name in ["b_1.txt", "a_2.txt", "a_1.dat"]:
+        (tmp_path / name).touch()
+
+    names = sorted(entry.name for entry in pyxutils.iter_files_with_stem(tmp_path, suffix=".txt"))
+    assert names == ["a_2.txt", "b_1.txt"]
+
+def test_float2str_array():
+    flts = np.array([23.5, 1.25, 0.0])
+    strings = pyxutils.float2str(flts, separator='p', precision=2, prefix='z', suffix='dex')
+    expected = [pyxutils.float2str(flt, separator='p', precision=2, prefix='z', suffix='dex') for flt in flts]
+    assert strings.tolist() == expected
+
+    flts = np.array([0.1, 2.5], dtype=np.float32)
+    strings = pyxutils.float2str(flts, separator='p')
+    assert strings.tolist() == [pyxutils.float2str(flt, separator='p') for flt in flts]
+    assert strings.tolist() == ['0p1', '2p5']
+
+    strings = pyxutils.float2str(np.array([]), precision=2)
+    assert strings.dtype.kind == 'U'
+    assert strings.shape == (0,)
+
+    assert pyxutils.float2str(np.array(23.5), separator='p', precision=2) == '23p50'
+    assert isinstance(pyxutils.float2str(np.array(23.5)), str)
+
+def test_files_with_stem_wildcards(tmp_path):
+    for name in ["ab.txt", "aba", "abba", "a1.dat"]:
+        (tmp_path / name).touch()
+
+    def names(paths):
+        return [os.path.basename(path) for path in paths]
+
+    assert names(pyxutils.files_with_stem(tmp_path, prefix="ab", suffix="ba")) == ["abba"]
+    assert names(pyxutils.files_with_stem(tmp_path, prefix="a?", suffix=".*")) == ["a1.dat", "ab.txt"]
+
+def test_float2str_non_int_precision():
+    with pytest.raises(TypeError):
+        pyxutils.float2str(23.5, precision=True)
+    with pytest.raises(TypeError):
+        pyxutils.float2str(23.5, precision=2.0)
+
+def test_float2str_numpy_int_precision():
+    assert pyxutils.float2str(1.5, precision=np.int64(2)) == '1.50'
 
-def test_float2str_prefix_suffix_separator():
-    assert pyxutils.float2str(23.5, prefix='z', separator='p', suffix='dex') == 'z23p5dex'
+def test_get_rng_from_seed_bool():
+    with pytest.raises(ValueError):
+        pyxutils.get_rng_from_seed(True)
 
+def test_get_rng_from_seed_numpy_int():
+    assert pyxutils.get_rng_from_seed(np.int64(5)).random() == np.random.default_rng(5).random()
 
-def test_str2float_int():
-    assert pyxutils.str2float('23') == 23
+def test_files_with_stem_subdirectories(tmp_path):
+    for directory in ["sub", "other"]:
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "a9.txt").touch()
 
-def test_str2float_float():
-    assert pyxutils.str2float('23p5') == 23.5
+    paths = pyxutils.files_with_stem(tmp_path, prefix="sub/a", suffix=".txt")
+    assert paths == [os.path.join(tmp_path, "sub", "a9.txt")]
 
-def test_str2float_float_decimals():
-    assert np.isclose(pyxutils.str2float('23p51234'), 23.51234)
+    paths = pyxutils.files_with_stem(os.path.join(tmp_path, "*"), prefix="a")
+    assert paths == [os.path.join(tmp_path, "other", "a9.txt"),
+                     os.path.join(tmp_path, "sub", "a9.txt")]
 
-def test_str2float_float_separator():
-    assert pyxutils.str2float('23_5', separator="_") == 23.5
+    with pytest.raises(ValueError):
+        list(pyxutils.iter_files_with_stem(tmp_path, prefix="sub/a"))
 
-def test_float2str_prefix_separator():
-    assert pyxutils.str2float('z23p5', prefix='z', separator='p') == 23.5
 
-def test_float2str_prefix_suffix_separator():
-    assert pyxutils.str2float('z23_5dex', prefix='z', separator='_', suffix='dex') == 23.5
+def test_files_with_stem_empty_loc(tmp_path, monkeypatch):
+    for name in ["a1", "a2", "b1"]:
+        (tmp_path / name).touch()
+    monkeypatch.chdir(tmp_path)
 
-def test_float2str_prefix_suffix_separator_decimals():
-    assert np.isclose(pyxutils.str2float('z23_51234dex', prefix='z', separator='_', suffix='dex'), 23.51234)
\ No newline at end of file
+    assert pyxutils.files_with_stem("", prefix="a") == ["a1", "a2"]
+    assert pyxutils.files_with_stem(".", prefix="a") == [os.path.join(".", "a1"), os.path.join(".", "a2")]